@@ -6,8 +6,10 @@ Uses playlist prefetching for seamless transition from announcement to stream.
 
 import contextlib
 import logging
+import os
 import socket
 import time
+from collections.abc import Iterable
 from pathlib import Path
 from threading import Event, Lock, Thread
 from typing import Protocol
@@ -27,6 +29,31 @@ logger = logging.getLogger(__name__)
 MAX_RECONNECT_BACKOFF_SECONDS = 60.0
 
 
+def prefetch_announcement_files(files: Iterable[Path]) -> None:
+    """Ask the kernel to load announcement files into the page cache.
+
+    Announcements are small and replayed often; warming them at startup
+    keeps SD-card reads off the button-press path. Missing files are skipped.
+
+    Args:
+        files: Announcement audio files to prefetch.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+
+    for file in files:
+        try:
+            fd = os.open(file, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError as e:
+            logger.debug("Could not prefetch %s: %s", file, e)
+        finally:
+            os.close(fd)
+
+
 class AudioPlayer(Protocol):
     """Protocol for audio playback."""
 
@@ -431,12 +458,11 @@ class MpvAudioPlayer:
 
                 # Wait for stream to start
                 for _ in range(50):
-                    if self._cancel.is_set():
+                    if self._cancel.wait(0.1):
                         with self._lock:
                             self._stop_internal(clear_desired=False)
                         return False
 
-                    time.sleep(0.1)
                     with self._lock:
                         current_player = self._player
                     if current_player is not player:
@@ -579,10 +605,9 @@ class MpvAudioPlayer:
 
             # Poll for stream to start playing (up to 5 seconds)
             for i in range(50):
-                if self._cancel.is_set():
+                if self._cancel.wait(0.1):
                     return False
 
-                time.sleep(0.1)
                 with self._lock:
                     if self._is_player_playing():
                         self._is_stream_active = True
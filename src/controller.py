@@ -7,7 +7,8 @@ for non-blocking audio operations.
 import logging
 from collections.abc import Callable
 from functools import partial
-from threading import Event, Lock, Thread
+from itertools import count
+from threading import Lock, Thread
 from typing import Protocol
 
 from .audio import AudioPlayer
@@ -30,6 +31,11 @@ class RadioController:
 
     All long-running audio operations are dispatched to a background
     worker thread so GPIO callbacks return immediately.
+
+    Invariant: ``self._audio`` is never called while ``self._lock`` is held.
+    Handlers snapshot the fields they need under the lock and release it
+    before touching audio, so a slow or blocking player can never stall
+    GPIO callbacks waiting on state.
     """
 
     def __init__(
@@ -48,6 +54,8 @@ class RadioController:
         self._config = config
         self._audio = audio_player
         self._network = network_manager
+        self._channels = config.channels
+        self._channel_count = len(config.channels)
         self._lock = Lock()
         self._state = RadioState(
             selected_channel_index=config.default_channel_index,
@@ -55,7 +63,8 @@ class RadioController:
             is_stream_active=False,
         )
         self._worker_thread: Thread | None = None
-        self._worker_cancel = Event()
+        self._worker_generations = count(1)
+        self._worker_generation = 0
 
     @property
     def state(self) -> RadioState:
@@ -71,33 +80,62 @@ class RadioController:
         Returns:
             Channel if found, None otherwise.
         """
-        if 0 <= index < len(self._config.channels):
-            return self._config.channels[index]
+        if 0 <= index < self._channel_count:
+            return self._channels[index]
         return None
 
-    def _dispatch(self, task: Callable[[], None]) -> None:
+    def _cancel_worker(self) -> int:
+        """Invalidate any running worker task.
+
+        Advancing the generation is a single GIL-atomic ``next()`` call, so
+        no kernel-level event object is needed.
+
+        Returns:
+            The new worker generation.
+        """
+        self._worker_generation = next(self._worker_generations)
+        return self._worker_generation
+
+    def _is_cancelled(self, generation: int) -> bool:
+        """Check whether a worker task has been superseded or cancelled.
+
+        Args:
+            generation: Generation the task was dispatched with.
+
+        Returns:
+            True if the task should stop.
+        """
+        return self._worker_generation != generation
+
+    def _dispatch(self, task: Callable[[int], None]) -> None:
         """Cancel current work and dispatch a new audio task to the worker.
 
         Args:
-            task: Callable to run on the worker thread.
+            task: Callable to run on the worker thread. Receives its
+                generation for cancellation checks.
         """
         # Signal current operation to stop
-        self._worker_cancel.set()
+        generation = self._cancel_worker()
         self._audio.stop()
 
         # Wait briefly for previous worker to notice cancellation
         if self._worker_thread is not None and self._worker_thread.is_alive():
             self._worker_thread.join(timeout=2.0)
 
-        self._worker_cancel.clear()
-        self._worker_thread = Thread(target=task, daemon=True, name="radio-worker")
+        self._worker_thread = Thread(
+            target=task,
+            args=(generation,),
+            daemon=True,
+            name="radio-worker",
+        )
         self._worker_thread.start()
 
-    def _play_channel_task(self, channel: Channel) -> None:
+    def _play_channel_task(self, channel: Channel, generation: int) -> None:
         """Worker task: announce and start playing a channel.
 
         Args:
             channel: Channel to play.
+            generation: Generation the task was dispatched with.
         """
         logger.info("Announcing channel: %s", channel.name)
 
@@ -106,7 +144,7 @@ class RadioController:
             channel.stream_url,
         )
 
-        if self._worker_cancel.is_set():
+        if self._is_cancelled(generation):
             return
 
         with self._lock:
@@ -127,13 +165,12 @@ class RadioController:
 
         self._announce_boot_connectivity()
 
-        with self._lock:
-            position = self._state.switch_position
-            channel_index = self._state.selected_channel_index
+        # RadioState is immutable, so a single read is a consistent snapshot
+        state = self._state
 
-        match position:
+        match state.switch_position:
             case SwitchPosition.ON:
-                channel = self._get_channel(channel_index)
+                channel = self._get_channel(state.selected_channel_index)
                 if channel is not None:
                     logger.info("Startup with switch ON, playing default channel")
                     self._dispatch(partial(self._play_channel_task, channel))
@@ -149,16 +186,15 @@ class RadioController:
             channel_index: Index of the channel button pressed.
         """
         with self._lock:
+            state = self._state
+
             # Ignore if switch is OFF
-            if self._state.switch_position == SwitchPosition.OFF:
+            if state.switch_position == SwitchPosition.OFF:
                 logger.debug("Ignoring channel button - switch is OFF")
                 return
 
             # Ignore if same channel already playing
-            if (
-                self._state.selected_channel_index == channel_index
-                and self._state.is_stream_active
-            ):
+            if state.selected_channel_index == channel_index and state.is_stream_active:
                 logger.debug("Ignoring channel button - already playing this channel")
                 return
 
@@ -168,7 +204,7 @@ class RadioController:
                 return
 
             # Update selected channel immediately
-            self._state = self._state.with_channel(channel_index)
+            self._state = state.with_channel(channel_index)
 
         # Dispatch long audio operation to worker thread (outside lock)
         logger.info(
@@ -183,14 +219,14 @@ class RadioController:
             position: New switch position.
         """
         with self._lock:
-            previous_position = self._state.switch_position
-            self._state = self._state.with_switch(position)
+            state = self._state
 
             # Ignore if position hasn't actually changed
-            if position == previous_position:
+            if position == state.switch_position:
                 return
 
-            channel_index = self._state.selected_channel_index
+            self._state = state.with_switch(position)
+            channel_index = state.selected_channel_index
 
         # Dispatch audio operations outside lock
         match position:
@@ -204,8 +240,12 @@ class RadioController:
                 logger.info("Switch turned OFF, stopping playback")
                 self._dispatch(self._switch_off_task)
 
-    def _switch_off_task(self) -> None:
-        """Worker task: stop playback and play goodbye announcement."""
+    def _switch_off_task(self, _generation: int) -> None:
+        """Worker task: stop playback and play goodbye announcement.
+
+        Args:
+            _generation: Generation the task was dispatched with (unused).
+        """
         self._audio.stop()
         self._audio.play_goodbye_announcement()
         with self._lock:
@@ -217,7 +257,7 @@ class RadioController:
         Stops current playback and plays shutdown announcement.
         """
         # Cancel any current worker operations
-        self._worker_cancel.set()
+        self._cancel_worker()
         self._audio.stop()
 
         logger.info("Shutdown requested via long-press")
@@ -226,7 +266,7 @@ class RadioController:
     def shutdown(self) -> None:
         """Perform graceful shutdown."""
         logger.info("Shutting down radio controller")
-        self._worker_cancel.set()
+        self._cancel_worker()
         self._audio.stop()
 
         if self._worker_thread is not None and self._worker_thread.is_alive():
@@ -7,7 +7,7 @@ Uses edge detection for both buttons and the selector switch.
 import logging
 import time
 from collections.abc import Callable
-from threading import Lock, Thread
+from threading import Lock, Timer
 from typing import Protocol
 
 from .models import GpioConfig, SwitchPosition
@@ -64,6 +64,11 @@ class RpiGpioAdapter:
         self._gpio = importlib.import_module("RPi.GPIO")
         self._gpio.setmode(self._gpio.BCM)
         self._gpio.setwarnings(False)
+        self._edge_map = {
+            "falling": self._gpio.FALLING,
+            "rising": self._gpio.RISING,
+            "both": self._gpio.BOTH,
+        }
 
     def setup_input(self, pin: int, pull_up: bool) -> None:
         """Configure a pin as input with pull-up/down resistor."""
@@ -82,12 +87,7 @@ class RpiGpioAdapter:
         bouncetime: int,
     ) -> None:
         """Add edge detection with callback."""
-        edge_map = {
-            "falling": self._gpio.FALLING,
-            "rising": self._gpio.RISING,
-            "both": self._gpio.BOTH,
-        }
-        edge_type = edge_map.get(edge, self._gpio.BOTH)
+        edge_type = self._edge_map.get(edge, self._gpio.BOTH)
         self._gpio.add_event_detect(
             pin,
             edge_type,
@@ -129,12 +129,17 @@ class GpioController:
         self._on_channel_button = on_channel_button
         self._on_switch_change = on_switch_change
         self._on_shutdown_requested = on_shutdown_requested
+        self._pin_to_index = {pin: i for i, pin in enumerate(config.channel_pins)}
+        self._debounce_ns = config.debounce_ms * 1_000_000
+        self._debounce_seconds = config.debounce_ms / 1000.0
+        self._switch_pin = config.switch_pin
+        self._invert_switch = config.invert_switch
         self._lock = Lock()
-        self._last_button_time: dict[int, float] = {}
+        self._last_button_ns: list[int] = [0] * len(config.channel_pins)
         self._last_switch_state: bool | None = None
-        self._running = False
-        self._channel1_press_start: float | None = None
-        self._long_press_monitor_thread: Thread | None = None
+        self._long_press_timer: Timer | None = None
+        self._switch_settle_timer: Timer | None = None
+        # Only ever flips False -> True, so plain reads need no lock
         self._shutdown_triggered = False
 
     def start(self) -> None:
@@ -144,7 +149,6 @@ class GpioController:
         # Setup channel buttons with pull-up resistors
         for i, pin in enumerate(self._config.channel_pins):
             self._gpio.setup_input(pin, pull_up=True)
-            self._last_button_time[pin] = 0
             self._gpio.add_event_detect(
                 pin,
                 edge="falling",
@@ -168,104 +172,99 @@ class GpioController:
             "ON" if self._last_switch_state else "OFF",
         )
 
-        # Start long-press monitor if long-press callbacks are provided
-        self._running = True
-        if self._on_shutdown_requested is not None:
-            self._long_press_monitor_thread = Thread(
-                target=self._monitor_long_press,
-                daemon=True,
-            )
-            self._long_press_monitor_thread.start()
-
     def _handle_button_press(self, pin: int) -> None:
         """Handle button press event with debouncing.
 
         Args:
             pin: GPIO pin that triggered the event.
         """
-        current_time = time.time()
-        debounce_seconds = self._config.debounce_ms / 1000.0
+        current_ns = time.monotonic_ns()
 
-        with self._lock:
-            last_time = self._last_button_time.get(pin, 0)
-            if current_time - last_time < debounce_seconds:
-                return  # Ignore bouncing
-
-            self._last_button_time[pin] = current_time
-
-        # Find channel index for this pin
-        try:
-            channel_index = self._config.channel_pins.index(pin)
-            logger.info("Channel %d button pressed (GPIO %d)", channel_index + 1, pin)
-
-            # Track press start for channel 1 (index 0) long-press detection
-            if channel_index == 0 and self._on_shutdown_requested is not None:
-                with self._lock:
-                    if not self._shutdown_triggered:
-                        self._channel1_press_start = current_time
-                        logger.debug(
-                            "Channel 1 press started, monitoring for long-press"
-                        )
-
-            self._on_channel_button(channel_index)
-        except ValueError:
+        channel_index = self._pin_to_index.get(pin)
+        if channel_index is None:
             logger.warning("Unknown button pin: %d", pin)
+            return
+
+        # Lock-free: each slot is only written by its own pin's edge callback,
+        # and a single list item read/write is atomic.
+        if current_ns - self._last_button_ns[channel_index] < self._debounce_ns:
+            return  # Ignore bouncing
+        self._last_button_ns[channel_index] = current_ns
+
+        logger.debug("Channel %d button pressed (GPIO %d)", channel_index + 1, pin)
+
+        # Arm long-press detection for channel 1 (index 0)
+        if (
+            channel_index == 0
+            and self._on_shutdown_requested is not None
+            and not self._shutdown_triggered
+        ):
+            self._arm_long_press_timer()
+            logger.debug("Channel 1 press started, monitoring for long-press")
+
+        self._on_channel_button(channel_index)
 
     def _handle_switch_edge(self, _pin: int) -> None:
         """Handle selector switch edge event.
 
-        Reads the current pin state and fires the switch callback
-        if the state actually changed.
+        Each edge (re)starts a settle timer; the pin is only read once the
+        switch has been quiet for the debounce period, so a bouncing contact
+        yields at most one callback per real transition.
 
         Args:
             _pin: GPIO pin that triggered the event (unused, always switch_pin).
         """
-        current_state = self._gpio.read(self._config.switch_pin)
+        timer = Timer(self._debounce_seconds, self._settle_switch)
+        timer.daemon = True
+        with self._lock:
+            previous = self._switch_settle_timer
+            self._switch_settle_timer = timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
+
+    def _settle_switch(self) -> None:
+        """Fire the switch callback if the settled state differs from the last."""
+        current_state = self._gpio.read(self._switch_pin)
+        if current_state == self._last_switch_state:
+            return  # Spurious edge or bounce, no lock needed to reject
 
         with self._lock:
             if current_state == self._last_switch_state:
-                return  # Spurious edge or bounce
+                return
             self._last_switch_state = current_state
 
-        effective_state = (
-            not current_state if self._config.invert_switch else current_state
-        )
-        position = SwitchPosition.ON if effective_state else SwitchPosition.OFF
+        position = self._to_switch_position(current_state)
         logger.info("Selector switch changed to %s", position.name)
         self._on_switch_change(position)
 
-    def _monitor_long_press(self) -> None:
-        """Monitor channel 1 for shutdown long-press."""
+    def _arm_long_press_timer(self) -> None:
+        """(Re)start the one-shot long-press timer for channel 1."""
+        previous = self._long_press_timer
+        if previous is not None:
+            previous.cancel()
+
+        timer = Timer(LONG_PRESS_THRESHOLD_SECONDS, self._check_long_press)
+        timer.daemon = True
+        self._long_press_timer = timer
+        timer.start()
+
+    def _check_long_press(self) -> None:
+        """Request shutdown if channel 1 is still held when the timer fires."""
         channel1_pin = self._config.channel_pins[0]
+        if self._gpio.read(channel1_pin):
+            return  # Button was released before threshold
 
-        while self._running:
-            with self._lock:
-                press_start = self._channel1_press_start
-
-            if press_start is not None:
-                # Check if button is still held
-                button_still_pressed = not self._gpio.read(channel1_pin)
-
-                if button_still_pressed:
-                    elapsed = time.time() - press_start
-                    if elapsed >= LONG_PRESS_THRESHOLD_SECONDS:
-                        with self._lock:
-                            if not self._shutdown_triggered:
-                                self._shutdown_triggered = True
-                                self._channel1_press_start = None
-
-                        logger.info(
-                            "Long-press detected (%.1f seconds), requesting shutdown",
-                            elapsed,
-                        )
-                        if self._on_shutdown_requested is not None:
-                            self._on_shutdown_requested()
-                else:
-                    # Button was released before threshold
-                    with self._lock:
-                        self._channel1_press_start = None
-
-            time.sleep(0.1)  # Poll every 100ms
+        if self._shutdown_triggered:
+            return
+        self._shutdown_triggered = True
+
+        logger.info(
+            "Long-press detected (%.1f seconds), requesting shutdown",
+            LONG_PRESS_THRESHOLD_SECONDS,
+        )
+        if self._on_shutdown_requested is not None:
+            self._on_shutdown_requested()
 
     def get_switch_position(self) -> SwitchPosition:
         """Get current switch position.
@@ -273,14 +272,18 @@ class GpioController:
         Returns:
             Current switch position.
         """
-        state = self._gpio.read(self._config.switch_pin)
-        effective_state = not state if self._config.invert_switch else state
-        return SwitchPosition.ON if effective_state else SwitchPosition.OFF
+        return self._to_switch_position(self._gpio.read(self._switch_pin))
+
+    def _to_switch_position(self, pin_state: bool) -> SwitchPosition:
+        """Map a raw switch pin level to a position, honoring invert_switch."""
+        return (
+            SwitchPosition.ON if pin_state ^ self._invert_switch else SwitchPosition.OFF
+        )
 
     def stop(self) -> None:
         """Stop GPIO monitoring and clean up."""
         logger.info("Stopping GPIO controller")
-        self._running = False
-        if self._long_press_monitor_thread is not None:
-            self._long_press_monitor_thread.join(timeout=1.0)
+        for timer in (self._long_press_timer, self._switch_settle_timer):
+            if timer is not None:
+                timer.cancel()
         self._gpio.cleanup()
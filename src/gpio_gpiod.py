@@ -0,0 +1,219 @@
+"""libgpiod-based GPIO adapter for Klarfunk Box.
+
+Blocks on kernel line-event file descriptors with a single epoll loop, so the
+event thread only wakes when a GPIO edge actually arrives.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+import select
+import threading
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GPIO_CHIP = "/dev/gpiochip0"
+CONSUMER_NAME = "klarfunk-box"
+
+# The kernel only reports an edge once the line has been stable for this
+# long, so it must stay far below a human tap. RPi.GPIO-style bouncetime
+# lockout is left to GpioController's software debounce.
+KERNEL_DEBOUNCE_MS = 5
+
+
+class LineRequest(Protocol):
+    """Subset of gpiod.LineRequest used by the adapter."""
+
+    @property
+    def fd(self) -> int:
+        """File descriptor that becomes readable on edge events."""
+        ...
+
+    def get_value(self, line: int) -> object:
+        """Read the current line value."""
+        ...
+
+    def reconfigure_lines(self, config: dict[int, object]) -> None:
+        """Apply new line settings."""
+        ...
+
+    def read_edge_events(self) -> list[object]:
+        """Drain pending edge events."""
+        ...
+
+    def release(self) -> None:
+        """Release the requested lines."""
+        ...
+
+
+class GpiodAdapter:
+    """Adapter for the libgpiod v2 character-device API.
+
+    Each pin gets its own line request; all request fds plus a self-pipe
+    are registered with one epoll instance so a single thread serves every
+    button and the selector switch, and cleanup() wakes it immediately.
+    """
+
+    def __init__(self, chip_path: str = DEFAULT_GPIO_CHIP) -> None:
+        """Open the GPIO chip.
+
+        Args:
+            chip_path: Path to the GPIO character device.
+
+        Raises:
+            ImportError: If the gpiod package is not available.
+            OSError: If the GPIO chip cannot be opened.
+        """
+        self._gpiod = importlib.import_module("gpiod")
+        self._line = importlib.import_module("gpiod.line")
+        self._chip = self._gpiod.Chip(chip_path)
+        self._lock = threading.Lock()
+        self._pull_up: dict[int, bool] = {}
+        self._requests: dict[int, LineRequest] = {}
+        self._callbacks: dict[int, Callable[[int], None]] = {}
+        self._fd_to_pin: dict[int, int] = {}
+        self._epoll = select.epoll()
+        self._wake_read_fd, self._wake_write_fd = os.pipe()
+        self._epoll.register(self._wake_read_fd, select.EPOLLIN)
+        self._thread: threading.Thread | None = None
+        self._cleanup_lock = threading.Lock()
+        self._cleaned_up = False
+
+    def setup_input(self, pin: int, pull_up: bool) -> None:
+        """Request a line as input with pull-up/down bias."""
+        request = self._chip.request_lines(
+            config={pin: self._line_settings(pull_up)},
+            consumer=CONSUMER_NAME,
+        )
+        with self._lock:
+            self._pull_up[pin] = pull_up
+            self._requests[pin] = request
+
+    def read(self, pin: int) -> bool:
+        """Read pin state."""
+        return self._requests[pin].get_value(pin) == self._line.Value.ACTIVE
+
+    def add_event_detect(
+        self,
+        pin: int,
+        edge: str,
+        callback: Callable[[int], None],
+        bouncetime: int,
+    ) -> None:
+        """Enable kernel edge detection and register the line with epoll.
+
+        ``bouncetime`` is accepted for interface parity but not passed to
+        the kernel: its debounce period is a stability filter that would
+        drop short taps and delay every edge by the full period. A fixed
+        few-millisecond period absorbs contact chatter instead, and
+        GpioController's lockout suppresses repeats. Kernels without line
+        debounce support reject the period; the line is then configured
+        without it.
+        """
+        edge_map = {
+            "falling": self._line.Edge.FALLING,
+            "rising": self._line.Edge.RISING,
+            "both": self._line.Edge.BOTH,
+        }
+        request = self._requests[pin]
+        pull_up = self._pull_up.get(pin, True)
+        edge_type = edge_map.get(edge, self._line.Edge.BOTH)
+        try:
+            request.reconfigure_lines(
+                {pin: self._line_settings(pull_up, edge_type, KERNEL_DEBOUNCE_MS)}
+            )
+        except OSError as e:
+            logger.warning(
+                "Kernel debounce unavailable for GPIO %d (%s); "
+                "using software debounce only",
+                pin,
+                e,
+            )
+            request.reconfigure_lines({pin: self._line_settings(pull_up, edge_type)})
+        with self._lock:
+            self._callbacks[pin] = callback
+            self._fd_to_pin[request.fd] = pin
+        self._epoll.register(request.fd, select.EPOLLIN)
+        self._ensure_event_thread()
+
+    def cleanup(self) -> None:
+        """Stop the event thread and release all lines.
+
+        Safe to call more than once and from several threads (e.g. a signal
+        handler racing normal shutdown); only the first call tears down.
+        """
+        with self._cleanup_lock:
+            if self._cleaned_up:
+                return
+            os.write(self._wake_write_fd, b"\0")
+            if self._thread is not None:
+                self._thread.join(timeout=1.0)
+                self._thread = None
+
+            with self._lock:
+                requests = tuple(self._requests.values())
+                self._requests.clear()
+                self._callbacks.clear()
+                self._fd_to_pin.clear()
+
+            for request in requests:
+                request.release()
+            self._epoll.close()
+            os.close(self._wake_read_fd)
+            os.close(self._wake_write_fd)
+            self._chip.close()
+            self._cleaned_up = True
+
+    def _line_settings(
+        self,
+        pull_up: bool,
+        edge: object | None = None,
+        debounce_ms: int = 0,
+    ) -> object:
+        return self._gpiod.LineSettings(
+            direction=self._line.Direction.INPUT,
+            bias=self._line.Bias.PULL_UP if pull_up else self._line.Bias.PULL_DOWN,
+            edge_detection=self._line.Edge.NONE if edge is None else edge,
+            debounce_period=timedelta(milliseconds=debounce_ms),
+        )
+
+    def _ensure_event_thread(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._event_loop,
+            daemon=True,
+            name="gpiod-events",
+        )
+        self._thread.start()
+
+    def _event_loop(self) -> None:
+        while True:
+            # Each wakeup returns every ready fd, so all pins are served in one pass
+            for fd, _mask in self._epoll.poll():
+                if fd == self._wake_read_fd:
+                    return
+                self._dispatch_events(fd)
+
+    def _dispatch_events(self, fd: int) -> None:
+        with self._lock:
+            pin = self._fd_to_pin.get(fd)
+            request = self._requests.get(pin) if pin is not None else None
+            callback = self._callbacks.get(pin) if pin is not None else None
+
+        if pin is None or request is None or callback is None:
+            return
+
+        # Coalesce a burst of bounce edges into a single callback: handlers
+        # only receive the pin and re-read its level themselves.
+        if not request.read_edge_events():
+            return
+        try:
+            callback(pin)
+        except Exception:
+            logger.exception("GPIO callback failed for pin %d", pin)
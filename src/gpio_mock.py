@@ -3,18 +3,35 @@
 from __future__ import annotations
 
 import logging
-import select
+import os
+import selectors
 import sys
 import termios
 import threading
 import time
 import tty
 from collections.abc import Callable
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 type TermiosSettings = list[int | list[int | bytes]]
 
+EDGE_RISING = 0b01
+EDGE_FALLING = 0b10
+EDGE_BOTH = EDGE_RISING | EDGE_FALLING
+_EDGE_MASKS = {"RISING": EDGE_RISING, "FALLING": EDGE_FALLING, "BOTH": EDGE_BOTH}
+
+
+@dataclass(slots=True)
+class _PinEventConfig:
+    """Edge-detection settings and last-event time for one pin."""
+
+    callback: Callable[[int], None]
+    edge_mask: int
+    bouncetime_seconds: float
+    last_event_time: float | None = None
+
 
 class KeyboardGpioAdapter:
     """GPIO adapter that maps keyboard input to GPIO events."""
@@ -24,25 +41,28 @@ class KeyboardGpioAdapter:
     def __init__(self, channel_pins: tuple[int, ...], switch_pin: int) -> None:
         self._pin_state: dict[int, bool] = {}
         self._pull_up: dict[int, bool] = {}
-        self._callbacks: dict[int, Callable[[int], None]] = {}
-        self._edges: dict[int, str] = {}
-        self._bouncetime_ms: dict[int, int] = {}
-        self._last_event_time: dict[int, float] = {}
+        self._pin_events: dict[int, _PinEventConfig] = {}
         self._channel_pins = channel_pins
         self._switch_pin = switch_pin
-        self._button_pins: set[int] = set(channel_pins)
-        self._press_until: dict[int, float] = {}
+        self._release_timers: dict[int, threading.Timer] = {}
         self._lock = threading.Lock()
-        self._running = True
+        self._stop_event = threading.Event()
         self._stdin_fd: int | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._wake_read_fd: int | None = None
+        self._wake_write_fd: int | None = None
         self._term_settings: TermiosSettings | None = None
-        self._term_restored = False
+        self._cleanup_lock = threading.Lock()
         self._cleaned_up = False
 
         if sys.stdin.isatty():
             self._stdin_fd = sys.stdin.fileno()
             self._term_settings = termios.tcgetattr(self._stdin_fd)
             tty.setcbreak(self._stdin_fd)
+            self._wake_read_fd, self._wake_write_fd = os.pipe()
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._stdin_fd, selectors.EVENT_READ)
+            self._selector.register(self._wake_read_fd, selectors.EVENT_READ)
         else:
             logger.warning("GPIO mock requires a TTY for keyboard input")
 
@@ -63,30 +83,8 @@ class KeyboardGpioAdapter:
 
     def read(self, pin: int) -> bool:
         """Read pin state (True = HIGH)."""
-        now = time.monotonic()
-        callback: Callable[[int], None] | None = None
         with self._lock:
-            until = self._press_until.get(pin)
-            if until is not None:
-                if now < until:
-                    return False
-                self._press_until.pop(pin, None)
-                if pin in self._button_pins:
-                    old_state = self._pin_state.get(pin, True)
-                    new_state = self._pull_up.get(pin, True)
-                    self._pin_state[pin] = new_state
-                    callback = self._get_callback_for_transition(
-                        pin,
-                        old_state,
-                        new_state,
-                        now,
-                    )
-            state = self._pin_state.get(pin, True)
-
-        if callback is not None:
-            callback(pin)
-
-        return state
+            return self._pin_state.get(pin, True)
 
     def add_event_detect(
         self,
@@ -96,36 +94,52 @@ class KeyboardGpioAdapter:
         bouncetime: int,
     ) -> None:
         """Add edge detection with callback."""
-        edge_name = edge.upper()
-        if edge_name not in {"RISING", "FALLING", "BOTH"}:
-            edge_name = "BOTH"
+        edge_mask = _EDGE_MASKS.get(edge.upper(), EDGE_BOTH)
         with self._lock:
-            self._callbacks[pin] = callback
-            self._edges[pin] = edge_name
-            self._bouncetime_ms[pin] = max(0, bouncetime)
-            self._button_pins.add(pin)
+            self._pin_events[pin] = _PinEventConfig(
+                callback=callback,
+                edge_mask=edge_mask,
+                bouncetime_seconds=max(0, bouncetime) / 1000.0,
+            )
 
     def cleanup(self) -> None:
-        """Clean up GPIO resources."""
-        if self._cleaned_up:
-            return
-        self._running = False
-        if self._thread.is_alive():
-            self._thread.join(timeout=1.0)
-        if (
-            self._stdin_fd is not None
-            and self._term_settings is not None
-            and not self._term_restored
-        ):
-            termios.tcsetattr(self._stdin_fd, termios.TCSADRAIN, self._term_settings)
-            self._term_restored = True
-        self._stdin_fd = None
-        self._term_settings = None
-        self._cleaned_up = True
+        """Clean up GPIO resources.
+
+        Safe to call more than once and from several threads (e.g. a signal
+        handler racing normal shutdown); only the first call tears down.
+        """
+        with self._cleanup_lock:
+            if self._cleaned_up:
+                return
+            self._stop_event.set()
+            with self._lock:
+                release_timers = tuple(self._release_timers.values())
+                self._release_timers.clear()
+            for release_timer in release_timers:
+                release_timer.cancel()
+            if self._wake_write_fd is not None:
+                os.write(self._wake_write_fd, b"\0")
+            if self._thread.is_alive():
+                self._thread.join(timeout=1.0)
+            if self._stdin_fd is not None and self._term_settings is not None:
+                termios.tcsetattr(
+                    self._stdin_fd, termios.TCSADRAIN, self._term_settings
+                )
+            if self._selector is not None:
+                self._selector.close()
+                self._selector = None
+            for fd in (self._wake_read_fd, self._wake_write_fd):
+                if fd is not None:
+                    os.close(fd)
+            self._wake_read_fd = None
+            self._wake_write_fd = None
+            self._stdin_fd = None
+            self._term_settings = None
+            self._cleaned_up = True
 
     def _keyboard_loop(self) -> None:
-        while self._running:
-            ch = self._read_char(timeout=0.1)
+        while not self._stop_event.is_set():
+            ch = self._read_char()
             if ch is None:
                 continue
 
@@ -139,13 +153,14 @@ class KeyboardGpioAdapter:
             if ch.lower() == "s":
                 self._toggle_switch()
 
-    def _read_char(self, timeout: float) -> str | None:
-        if self._stdin_fd is None:
-            time.sleep(timeout)
+    def _read_char(self) -> str | None:
+        """Block until a key arrives or cleanup() wakes the loop."""
+        if self._selector is None:
+            self._stop_event.wait()
             return None
 
-        ready, _, _ = select.select([self._stdin_fd], [], [], timeout)
-        if not ready:
+        ready = {key.fd for key, _mask in self._selector.select()}
+        if self._wake_read_fd in ready:
             return None
         data = sys.stdin.read(1)
         return data if data else None
@@ -163,9 +178,14 @@ class KeyboardGpioAdapter:
     def _press_button(self, pin: int) -> None:
         now = time.monotonic()
         callback: Callable[[int], None] | None = None
+        # Key repeats while a key is held keep extending the press window
+        release_timer = threading.Timer(
+            self._HOLD_WINDOW_SECONDS, self._release_button, args=(pin,)
+        )
+        release_timer.daemon = True
         with self._lock:
-            until = self._press_until.get(pin)
-            if until is None or now >= until:
+            previous = self._release_timers.get(pin)
+            if previous is None:
                 old_state = self._pin_state.get(pin, True)
                 self._pin_state[pin] = False
                 callback = self._get_callback_for_transition(
@@ -174,7 +194,31 @@ class KeyboardGpioAdapter:
                     False,
                     now,
                 )
-            self._press_until[pin] = now + self._HOLD_WINDOW_SECONDS
+            self._release_timers[pin] = release_timer
+
+        if previous is not None:
+            previous.cancel()
+        release_timer.start()
+
+        if callback is not None:
+            callback(pin)
+
+    def _release_button(self, pin: int) -> None:
+        callback: Callable[[int], None] | None = None
+        with self._lock:
+            # A newer press replaced this timer; it owns the release now
+            if self._release_timers.get(pin) is not threading.current_thread():
+                return
+            del self._release_timers[pin]
+            old_state = self._pin_state.get(pin, True)
+            new_state = self._pull_up.get(pin, True)
+            self._pin_state[pin] = new_state
+            callback = self._get_callback_for_transition(
+                pin,
+                old_state,
+                new_state,
+                time.monotonic(),
+            )
 
         if callback is not None:
             callback(pin)
@@ -204,17 +248,14 @@ class KeyboardGpioAdapter:
     ) -> Callable[[int], None] | None:
         if old_state == new_state:
             return None
-        edge = self._edges.get(pin, "BOTH")
-        if edge == "RISING" and not (not old_state and new_state):
-            return None
-        if edge == "FALLING" and not (old_state and not new_state):
+        config = self._pin_events.get(pin)
+        if config is None:
             return None
-        callback = self._callbacks.get(pin)
-        if callback is None:
+        transition = EDGE_RISING if new_state else EDGE_FALLING
+        if not config.edge_mask & transition:
             return None
-        bouncetime_ms = self._bouncetime_ms.get(pin, 0)
-        last_time = self._last_event_time.get(pin)
-        if last_time is not None and (now - last_time) * 1000 < bouncetime_ms:
+        last_time = config.last_event_time
+        if last_time is not None and now - last_time < config.bouncetime_seconds:
             return None
-        self._last_event_time[pin] = now
-        return callback
+        config.last_event_time = now
+        return config.callback
@@ -5,25 +5,28 @@ A simple internet radio application for older adults on Raspberry Pi.
 
 import argparse
 import logging
-import platform
+import os
 import resource
 import signal
 import subprocess
 import sys
-import time
-from functools import lru_cache
+from collections.abc import Iterable
+from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from threading import Event, Thread
 from types import FrameType
+from typing import TYPE_CHECKING
 
-from .audio import MpvAudioPlayer
 from .config import DEFAULT_CONFIG_PATH, load_config
 from .constants import ANNOUNCEMENT_TIMEOUT_SECONDS
-from .controller import RadioController
-from .gpio import GpioController, RpiGpioAdapter
+from .gpio import GpioController, GpioInterface, RpiGpioAdapter
+from .gpio_gpiod import GpiodAdapter
 from .gpio_mock import KeyboardGpioAdapter
-from .network import NetworkManager
+from .platform_detect import get_default_gpio_backend, is_raspberry_pi
+
+if TYPE_CHECKING:
+    from .audio import MpvAudioPlayer
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +45,9 @@ def setup_logging(verbose: bool, log_file: Path | None = None) -> None:
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
-    handlers: list[logging.Handler] = [logging.StreamHandler()]
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [stream_handler]
 
     if log_file is not None:
         file_handler = RotatingFileHandler(
@@ -53,15 +58,13 @@ def setup_logging(verbose: bool, log_file: Path | None = None) -> None:
         file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=handlers,
-    )
+    logging.basicConfig(level=level, handlers=handlers)
 
 
 def log_fd_limits() -> None:
     """Log file descriptor limits for diagnostic purposes."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     try:
         soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
         logger.info("File descriptor limits: soft=%d, hard=%d", soft, hard)
@@ -75,7 +78,6 @@ def parse_args() -> argparse.Namespace:
     Returns:
         Parsed arguments.
     """
-    default_gpio_backend = get_default_gpio_backend()
     parser = argparse.ArgumentParser(
         prog="klarfunk-box",
         description="A simple internet radio for older adults",
@@ -95,9 +97,9 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--gpio",
-        choices=["rpi", "mock"],
-        default=default_gpio_backend,
-        help="GPIO backend to use (rpi or mock)",
+        choices=["rpi", "gpiod", "mock"],
+        default=None,
+        help="GPIO backend to use (default: rpi on a Raspberry Pi, otherwise mock)",
     )
     parser.add_argument(
         "--log-file",
@@ -111,76 +113,91 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Path to heartbeat file (updated every 30s for external monitoring)",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    # Only probe the platform when --gpio was not given explicitly
+    if args.gpio is None:
+        args.gpio = get_default_gpio_backend()
+    return args
 
 
-def get_default_gpio_backend() -> str:
-    """Select the default GPIO backend based on the current platform."""
-    if is_raspberry_pi():
-        return "rpi"
-    return "mock"
+def find_existing_files(paths: Iterable[Path]) -> frozenset[Path]:
+    """Return the subset of paths that exist.
 
+    Lists each distinct parent directory once with os.scandir instead of
+    issuing one stat() per file.
 
-@lru_cache(maxsize=1)
-def is_raspberry_pi() -> bool:
-    """Detect whether the current machine is a Raspberry Pi."""
-    if platform.system() != "Linux":
-        return False
+    Args:
+        paths: Files to look for.
+
+    Returns:
+        The paths whose names are present in their parent directory.
+    """
+    candidates = tuple(paths)
+    names_by_parent = {
+        parent: _list_directory_names(parent)
+        for parent in {path.parent for path in candidates}
+    }
+    return frozenset(
+        path for path in candidates if path.name in names_by_parent[path.parent]
+    )
 
-    model_path = Path("/sys/firmware/devicetree/base/model")
-    if not model_path.exists():
-        return False
 
+def _list_directory_names(directory: Path) -> frozenset[str]:
     try:
-        model_text = model_path.read_text(
-            encoding="utf-8",
-            errors="ignore",
-        )
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
     except OSError:
-        return False
+        return frozenset()
 
-    return "Raspberry Pi" in model_text
 
-
-def start_heartbeat_writer(
-    heartbeat_file: Path,
-    stop_event: Event,
-) -> Thread:
-    """Start a background thread that writes timestamps to a heartbeat file.
+def write_heartbeat(heartbeat_path: str) -> None:
+    """Write the current local time to the heartbeat file.
 
     Args:
-        heartbeat_file: Path to the heartbeat file.
-        stop_event: Event to signal the thread to stop.
-
-    Returns:
-        The started heartbeat thread.
+        heartbeat_path: Path to the heartbeat file.
     """
+    timestamp = datetime.now().astimezone().isoformat(timespec="seconds")
+    try:
+        # Reopen each tick so a deleted or rotated file is recreated
+        fd = os.open(heartbeat_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, timestamp.encode("ascii"))
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.warning("Failed to write heartbeat file: %s", e)
 
-    def _heartbeat_loop() -> None:
-        while not stop_event.wait(HEARTBEAT_INTERVAL_SECONDS):
-            try:
-                heartbeat_file.write_text(
-                    time.strftime("%Y-%m-%dT%H:%M:%S%z"),
-                    encoding="utf-8",
-                )
-            except OSError as e:
-                logger.warning("Failed to write heartbeat file: %s", e)
 
-    thread = Thread(target=_heartbeat_loop, daemon=True, name="heartbeat")
-    thread.start()
+def wait_for_shutdown(shutdown_event: Event, heartbeat_file: Path | None) -> None:
+    """Block until shutdown is requested, writing heartbeats if configured.
+
+    The heartbeat is written from the otherwise idle main thread, so no
+    dedicated heartbeat thread is needed.
+
+    Args:
+        shutdown_event: Event set when the application should stop.
+        heartbeat_file: Optional path to the heartbeat file.
+    """
+    if heartbeat_file is None:
+        shutdown_event.wait()
+        return
+
     logger.info(
         "Heartbeat file: %s (every %.0fs)", heartbeat_file, HEARTBEAT_INTERVAL_SECONDS
     )
-    return thread
+    heartbeat_path = os.fspath(heartbeat_file)
+    while not shutdown_event.wait(HEARTBEAT_INTERVAL_SECONDS):
+        write_heartbeat(heartbeat_path)
 
 
 def start_startup_branding_announcement(
-    audio_player: MpvAudioPlayer,
+    audio_player: "MpvAudioPlayer",
     announcement_file: Path,
-) -> Thread | None:
-    """Start startup branding announcement playback in the background."""
-    if not announcement_file.exists():
-        return None
+) -> Thread:
+    """Start startup branding announcement playback in the background.
+
+    The caller is expected to have checked that the file exists.
+    """
 
     def _play_startup_branding() -> None:
         logger.info("Playing startup branding announcement")
@@ -220,29 +237,48 @@ def main() -> int:
         logger.exception("Invalid configuration: %s", e)
         return 1
 
-    # Validate audio files exist
-    for channel in config.channels:
-        if not channel.announcement_file.exists():
-            logger.warning(
-                "Announcement file not found for channel '%s': %s",
-                channel.name,
-                channel.announcement_file,
-            )
-
-    # Validate error announcement files
-    error_files = [
-        ("retrying", config.error_announcements.retrying),
-        ("failed", config.error_announcements.failed),
-        ("no_internet", config.error_announcements.no_internet),
-    ]
-    for name, path in error_files:
-        if not path.exists():
-            logger.warning("Error announcement file '%s' not found: %s", name, path)
-    if not config.startup_branding_announcement.exists():
+    # Validate audio files exist, reporting all missing ones in one record
+    announcement_files = (
+        *(
+            (f"channel '{channel.name}'", channel.announcement_file)
+            for channel in config.channels
+        ),
+        ("error 'retrying'", config.error_announcements.retrying),
+        ("error 'failed'", config.error_announcements.failed),
+        ("error 'no_internet'", config.error_announcements.no_internet),
+        ("startup branding", config.startup_branding_announcement),
+    )
+    existing_files = find_existing_files(path for _, path in announcement_files)
+    missing_files = tuple(
+        (label, path)
+        for label, path in announcement_files
+        if path not in existing_files
+    )
+    if missing_files:
         logger.warning(
-            "Startup branding announcement file not found: %s",
-            config.startup_branding_announcement,
+            "Announcement files not found:\n%s",
+            "\n".join(f"  {label}: {path}" for label, path in missing_files),
+        )
+
+    # Deferred until arguments and config are valid: these pull in libmpv,
+    # so --help and configuration errors return without loading it.
+    from .audio import MpvAudioPlayer, prefetch_announcement_files
+    from .controller import RadioController
+    from .network import NetworkManager
+
+    prefetch_announcement_files(
+        (
+            *(channel.announcement_file for channel in config.channels),
+            config.error_announcements.retrying,
+            config.error_announcements.failed,
+            config.error_announcements.no_internet,
+            config.boot_announcements.connected,
+            config.boot_announcements.no_internet,
+            config.goodbye_announcement,
+            config.selector_off_announcement,
+            config.shutdown_announcement,
         )
+    )
 
     # Initialize components
     audio_player = MpvAudioPlayer(
@@ -254,10 +290,12 @@ def main() -> int:
         selector_off_announcement=config.selector_off_announcement,
         shutdown_announcement=config.shutdown_announcement,
     )
-    startup_branding_thread = start_startup_branding_announcement(
-        audio_player=audio_player,
-        announcement_file=config.startup_branding_announcement,
-    )
+    startup_branding_thread: Thread | None = None
+    if config.startup_branding_announcement in existing_files:
+        startup_branding_thread = start_startup_branding_announcement(
+            audio_player=audio_player,
+            announcement_file=config.startup_branding_announcement,
+        )
 
     network_manager = NetworkManager(
         nmcli_path=config.wifi.nmcli_path,
@@ -275,29 +313,41 @@ def main() -> int:
     )
 
     gpio_mode = args.gpio
-    is_pi = is_raspberry_pi()
-    if gpio_mode == "rpi" and not is_pi:
+    if gpio_mode == "rpi" and not is_raspberry_pi():
         logger.warning("RPi GPIO selected but Raspberry Pi not detected; using mock.")
         gpio_mode = "mock"
 
-    if gpio_mode == "mock":
-        gpio = KeyboardGpioAdapter(
-            channel_pins=config.gpio.channel_pins,
-            switch_pin=config.gpio.switch_pin,
-        )
-        logger.info(
-            "GPIO mock controls: 1-5 = channels, s = toggle switch, hold 1 for shutdown"
-        )
-    else:
-        try:
-            gpio = RpiGpioAdapter()
-        except (ImportError, RuntimeError, OSError) as e:
-            logger.critical("Failed to initialize GPIO: %s", e)
-            logger.critical(
-                "Ensure RPi.GPIO is installed and /dev/gpiomem is accessible "
-                "(try: sudo usermod -aG gpio $USER)"
+    gpio: GpioInterface
+    match gpio_mode:
+        case "mock":
+            gpio = KeyboardGpioAdapter(
+                channel_pins=config.gpio.channel_pins,
+                switch_pin=config.gpio.switch_pin,
+            )
+            logger.info(
+                "GPIO mock controls: 1-5 = channels, s = toggle switch, "
+                "hold 1 for shutdown"
             )
-            return 1
+        case "gpiod":
+            try:
+                gpio = GpiodAdapter()
+            except (ImportError, OSError) as e:
+                logger.critical("Failed to initialize GPIO: %s", e)
+                logger.critical(
+                    "Ensure gpiod is installed and /dev/gpiochip0 is accessible "
+                    "(try: sudo usermod -aG gpio $USER)"
+                )
+                return 1
+        case _:
+            try:
+                gpio = RpiGpioAdapter()
+            except (ImportError, RuntimeError, OSError) as e:
+                logger.critical("Failed to initialize GPIO: %s", e)
+                logger.critical(
+                    "Ensure RPi.GPIO is installed and /dev/gpiomem is accessible "
+                    "(try: sudo usermod -aG gpio $USER)"
+                )
+                return 1
 
     # Event-based shutdown signalling (works for both signals and mock mode)
     shutdown_event = Event()
@@ -326,13 +376,8 @@ def main() -> int:
         logger.info("Shutdown signal received (%s)", signal.Signals(signum).name)
         shutdown_event.set()
 
-    signal.signal(signal.SIGINT, handle_signal)
-    signal.signal(signal.SIGTERM, handle_signal)
-
-    # Start heartbeat writer if configured
-    heartbeat_thread: Thread | None = None
-    if args.heartbeat_file is not None:
-        heartbeat_thread = start_heartbeat_writer(args.heartbeat_file, shutdown_event)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, handle_signal)
 
     # Start GPIO controller
     gpio_controller.start()
@@ -349,16 +394,13 @@ def main() -> int:
     logger.info("Klarfunk Box is running. Press Ctrl+C to stop.")
 
     # Main loop — wait for shutdown event (works for signals AND mock mode)
-    shutdown_event.wait()
+    wait_for_shutdown(shutdown_event, args.heartbeat_file)
 
     # Graceful shutdown
     logger.info("Shutting down Klarfunk Box")
     gpio_controller.stop()
     radio_controller.shutdown()
 
-    if heartbeat_thread is not None:
-        heartbeat_thread.join(timeout=1.0)
-
     logger.info("Goodbye!")
 
     return 0
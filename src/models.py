@@ -5,7 +5,7 @@ Immutable data structures representing configuration and application state.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum, auto
 from pathlib import Path
 
@@ -17,7 +17,7 @@ class SwitchPosition(Enum):
     ON = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Channel:
     """A radio channel configuration."""
 
@@ -27,7 +27,7 @@ class Channel:
     announcement_file: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GpioConfig:
     """GPIO pin configuration."""
 
@@ -37,7 +37,7 @@ class GpioConfig:
     invert_switch: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioConfig:
     """Audio output configuration."""
 
@@ -47,7 +47,7 @@ class AudioConfig:
     buffer: StreamBufferConfig
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StreamBufferConfig:
     """Streaming buffer configuration for MPV."""
 
@@ -57,7 +57,7 @@ class StreamBufferConfig:
     network_timeout_seconds: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     """Stream retry configuration."""
 
@@ -65,7 +65,7 @@ class RetryConfig:
     delay_seconds: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StreamWatchdogConfig:
     """Watchdog configuration for stream dropouts."""
 
@@ -79,7 +79,7 @@ class StreamWatchdogConfig:
     internet_check_timeout_seconds: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WifiConfig:
     """WiFi management configuration."""
 
@@ -88,7 +88,7 @@ class WifiConfig:
     connect_timeout_seconds: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BootAnnouncementsConfig:
     """Boot announcement audio files."""
 
@@ -96,7 +96,7 @@ class BootAnnouncementsConfig:
     no_internet: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorAnnouncementsConfig:
     """Error announcement audio files."""
 
@@ -105,7 +105,7 @@ class ErrorAnnouncementsConfig:
     no_internet: Path  # "No internet connection"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Complete application configuration."""
 
@@ -125,7 +125,7 @@ class AppConfig:
     shutdown_announcement: Path
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RadioState:
     """Current radio state."""
 
@@ -135,24 +135,12 @@ class RadioState:
 
     def with_channel(self, index: int) -> RadioState:
         """Return new state with updated channel."""
-        return RadioState(
-            selected_channel_index=index,
-            switch_position=self.switch_position,
-            is_stream_active=self.is_stream_active,
-        )
+        return replace(self, selected_channel_index=index)
 
     def with_switch(self, position: SwitchPosition) -> RadioState:
         """Return new state with updated switch position."""
-        return RadioState(
-            selected_channel_index=self.selected_channel_index,
-            switch_position=position,
-            is_stream_active=self.is_stream_active,
-        )
+        return replace(self, switch_position=position)
 
     def with_stream_active(self, active: bool) -> RadioState:
         """Return new state with updated stream status."""
-        return RadioState(
-            selected_channel_index=self.selected_channel_index,
-            switch_position=self.switch_position,
-            is_stream_active=active,
-        )
+        return replace(self, is_stream_active=active)
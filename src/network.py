@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import logging
+import shutil
 import socket
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Result[T, E]:
     """Simple Result container for command outcomes."""
 
@@ -21,7 +23,7 @@ class Result[T, E]:
         return self.error is None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandResult:
     """Raw command result."""
 
@@ -31,7 +33,7 @@ class CommandResult:
     error: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectivityStatus:
     """Connectivity status summary."""
 
@@ -40,7 +42,7 @@ class ConnectivityStatus:
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActiveWifiInfo:
     """Active WiFi connection details."""
 
@@ -52,7 +54,7 @@ class ActiveWifiInfo:
     dns_servers: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SavedWifiNetwork:
     """Saved WiFi network details."""
 
@@ -110,7 +112,10 @@ class NetworkManager:
         ):
             msg = "internet_check_port must be between 1 and 65535"
             raise ValueError(msg)
-        self._nmcli_path = nmcli_path
+        # Resolve once so each call skips the PATH search; fall back to the
+        # configured value so a missing binary is still reported by name.
+        self._nmcli_path = shutil.which(nmcli_path) or nmcli_path
+        self._nmcli_missing = False
         self._command_timeout_seconds = command_timeout_seconds
         self._connect_timeout_seconds = connect_timeout_seconds
         self._internet_check_hosts = internet_check_hosts
@@ -175,7 +180,9 @@ class NetworkManager:
         device = active.get("DEVICE", "")
         ip_record = self._get_ip_details(device)
         dns_values = _get_all_prefixed(ip_record, "IP4.DNS")
-        dns_servers = tuple(item for value in dns_values for item in _split_dns(value))
+        dns_servers = tuple(
+            [item for value in dns_values for item in _split_dns(value)]
+        )
         info = ActiveWifiInfo(
             ssid=active.get("SSID", ""),
             device=device,
@@ -194,7 +201,7 @@ class NetworkManager:
                 "multiline",
                 "-t",
                 "-f",
-                "NAME,TYPE,802-11-wireless.ssid,802-11-wireless-security.key-mgmt",
+                "NAME,TYPE,ACTIVE,802-11-wireless.ssid,802-11-wireless-security.key-mgmt",
                 "connection",
                 "show",
             ),
@@ -206,21 +213,18 @@ class NetworkManager:
             )
             return Result(value=None, error=msg)
 
-        active_names = self._get_active_wifi_names()
         records = _parse_multiline_records(result.stdout)
-        wifi_records = tuple(
-            record for record in records if record.get("TYPE") == "wifi"
-        )
-        networks = tuple(
+        networks = [
             SavedWifiNetwork(
                 name=record.get("NAME", ""),
                 ssid=record.get("802-11-wireless.ssid", ""),
                 security=record.get("802-11-wireless-security.key-mgmt", "") or "open",
-                is_active=record.get("NAME", "") in active_names,
+                is_active=record.get("ACTIVE") == "yes",
             )
-            for record in wifi_records
-        )
-        return Result(value=networks, error=None)
+            for record in records
+            if record.get("TYPE") == "wifi"
+        ]
+        return Result(value=tuple(networks), error=None)
 
     def connect_to_saved_wifi(self, name: str) -> Result[bool, str]:
         """Connect to a saved WiFi connection by name."""
@@ -233,29 +237,6 @@ class NetworkManager:
             return Result(value=None, error=msg)
         return Result(value=True, error=None)
 
-    def _get_active_wifi_names(self) -> tuple[str, ...]:
-        result = self._run_nmcli(
-            (
-                "-m",
-                "multiline",
-                "-t",
-                "-f",
-                "NAME,TYPE",
-                "connection",
-                "show",
-                "--active",
-            ),
-            timeout_seconds=self._command_timeout_seconds,
-        )
-        if result.error is not None or result.returncode != 0:
-            return ()
-
-        records = _parse_multiline_records(result.stdout)
-        active_wifi = tuple(
-            record.get("NAME", "") for record in records if record.get("TYPE") == "wifi"
-        )
-        return tuple(name for name in active_wifi if name)
-
     def _get_ip_details(self, device: str) -> dict[str, str]:
         if not device:
             return {}
@@ -285,16 +266,24 @@ class NetworkManager:
     def _run_nmcli(
         self, args: tuple[str, ...], timeout_seconds: float
     ) -> CommandResult:
+        if self._nmcli_missing:
+            return CommandResult(1, "", "", f"nmcli not found at '{self._nmcli_path}'")
+
         cmd = (self._nmcli_path, *args)
         try:
             completed = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
+                # nmcli emits UTF-8 (SSIDs may be non-ASCII); naming the codec
+                # skips the per-call locale lookup and survives a C locale
+                encoding="utf-8",
+                errors="replace",
                 check=False,
                 timeout=timeout_seconds,
             )
         except FileNotFoundError:
+            # Remember the miss so later calls skip the doomed fork+exec
+            self._nmcli_missing = True
             msg = f"nmcli not found at '{self._nmcli_path}'"
             logger.warning(msg)
             return CommandResult(1, "", "", msg)
@@ -311,19 +300,31 @@ class NetworkManager:
         )
 
     def _check_hosts(self) -> bool:
-        if not self._internet_check_hosts:
+        hosts = self._internet_check_hosts
+        if not hosts:
             return False
+        if len(hosts) == 1:
+            return self._probe_host(hosts[0])
+
+        # Probe all hosts at once so a stalled host costs one timeout, not N
+        executor = ThreadPoolExecutor(
+            max_workers=len(hosts), thread_name_prefix="connectivity-probe"
+        )
+        try:
+            futures = [executor.submit(self._probe_host, host) for host in hosts]
+            return any(future.result() for future in as_completed(futures))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        for host in self._internet_check_hosts:
-            try:
-                with socket.create_connection(
-                    (host, self._internet_check_port),
-                    timeout=self._internet_check_timeout_seconds,
-                ):
-                    return True
-            except OSError:
-                continue
-        return False
+    def _probe_host(self, host: str) -> bool:
+        try:
+            with socket.create_connection(
+                (host, self._internet_check_port),
+                timeout=self._internet_check_timeout_seconds,
+            ):
+                return True
+        except OSError:
+            return False
 
 
 def _parse_multiline_records(output: str) -> tuple[dict[str, str], ...]:
@@ -337,11 +338,12 @@ def _parse_multiline_records(output: str) -> tuple[dict[str, str], ...]:
                 current = {}
             continue
 
-        if ":" not in line:
+        key, sep, value = line.partition(":")
+        if not sep:
             continue
 
-        key, value = line.split(":", 1)
-        current = {**current, key: value}
+        # Mutating in place is safe: a fresh dict starts on every blank line
+        current[key] = value
 
     if current:
         records.append(current)
@@ -360,12 +362,12 @@ def _get_first_prefixed(record: dict[str, str], prefix: str) -> str:
 
 
 def _get_all_prefixed(record: dict[str, str], prefix: str) -> tuple[str, ...]:
-    values = tuple(
+    prefix_key = f"{prefix}["
+    return tuple(
         value
         for key, value in record.items()
-        if key == prefix or key.startswith(f"{prefix}[")
+        if key == prefix or key.startswith(prefix_key)
     )
-    return values
 
 
 def _split_dns(value: str) -> tuple[str, ...]:
@@ -382,9 +384,8 @@ def _split_dns(value: str) -> tuple[str, ...]:
 
 
 def _to_int(value: str) -> int | None:
-    cleaned = value.strip()
-    if not cleaned:
-        return None
-    if not cleaned.isdigit():
+    # int() strips surrounding whitespace and validates in a single pass
+    try:
+        return int(value)
+    except ValueError:
         return None
-    return int(cleaned)
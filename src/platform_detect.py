@@ -0,0 +1,36 @@
+"""Platform detection for Klarfunk Box."""
+
+import platform
+from functools import lru_cache
+from pathlib import Path
+
+DEVICE_TREE_MODEL_PATH = Path("/sys/firmware/devicetree/base/model")
+
+
+def get_default_gpio_backend() -> str:
+    """Select the default GPIO backend based on the current platform.
+
+    The libgpiod backend is opt-in via ``--gpio gpiod``; a Pi defaults to
+    RPi.GPIO.
+    """
+    return "rpi" if is_raspberry_pi() else "mock"
+
+
+@lru_cache(maxsize=1)
+def is_raspberry_pi() -> bool:
+    """Detect whether the current machine is a Raspberry Pi."""
+    if platform.system() != "Linux":
+        return False
+    # Every Pi is ARM; skip the sysfs read on x86 development machines
+    if not platform.machine().startswith(("arm", "aarch64")):
+        return False
+
+    # One open() covers the missing-file case; the model string is short,
+    # so a bounded binary read avoids decoding the whole node.
+    try:
+        with DEVICE_TREE_MODEL_PATH.open("rb") as model_file:
+            model = model_file.read(128)
+    except OSError:
+        return False
+
+    return b"Raspberry Pi" in model
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from threading import Event
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
@@ -196,9 +197,15 @@ class FakeMpvPlayer:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def tmp_audio_files(tmp_path: Path) -> dict[str, Path]:
-    """Create empty placeholder audio files in a temp directory."""
+@pytest.fixture(scope="session")
+def tmp_audio_files(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Mapping[str, Path]:
+    """Create empty placeholder audio files once for the whole session.
+
+    The mapping is read-only because every test shares it.
+    """
+    audio_dir = tmp_path_factory.mktemp("audio")
     files = {
         "channel_1": "channel_1.mp3",
         "channel_2": "channel_2.mp3",
@@ -213,13 +220,10 @@ def tmp_audio_files(tmp_path: Path) -> dict[str, Path]:
         "error_failed": "error_failed.mp3",
         "error_no_internet": "error_no_internet.mp3",
     }
-    result: dict[str, Path] = {}
-    for key, filename in files.items():
-        p = tmp_path / filename
+    result = {key: audio_dir / filename for key, filename in files.items()}
+    for p in result.values():
         p.write_bytes(b"\x00" * 10)  # Minimal non-empty file
-        result[key] = p
-    result["audio_dir"] = tmp_path
-    return result
+    return MappingProxyType({**result, "audio_dir": audio_dir})
 
 
 # ---------------------------------------------------------------------------
@@ -340,9 +344,12 @@ def make_app_config(audio_dir: Path) -> AppConfig:
     )
 
 
-@pytest.fixture
-def app_config(tmp_audio_files: dict[str, Path]) -> AppConfig:
-    """Create a complete AppConfig with real temp audio files."""
+@pytest.fixture(scope="session")
+def app_config(tmp_audio_files: Mapping[str, Path]) -> AppConfig:
+    """Create a complete AppConfig with real temp audio files.
+
+    Built once per session; AppConfig is frozen, so tests can share it.
+    """
     return make_app_config(tmp_audio_files["audio_dir"])
 
 
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from threading import Thread
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
 
-from src.audio import MpvAudioPlayer
+from src.audio import MpvAudioPlayer, prefetch_announcement_files
 from src.models import (
     ErrorAnnouncementsConfig,
     RetryConfig,
@@ -27,25 +28,26 @@ from tests.conftest import (
 type MakePlayerFixture = Callable[..., MpvAudioPlayer]
 
 
-@pytest.fixture
-def audio_files(tmp_path: Path) -> dict[str, Path]:
-    """Create temp audio files for announcements."""
+@pytest.fixture(scope="module")
+def audio_files(tmp_path_factory: pytest.TempPathFactory) -> Mapping[str, Path]:
+    """Create temp audio files for announcements once per module."""
+    audio_dir = tmp_path_factory.mktemp("announcements")
     files = {
-        "retrying": tmp_path / "error_retrying.mp3",
-        "failed": tmp_path / "error_failed.mp3",
-        "no_internet": tmp_path / "error_no_internet.mp3",
-        "goodbye": tmp_path / "goodbye.mp3",
-        "selector_off": tmp_path / "selector_off.mp3",
-        "shutdown": tmp_path / "shutdown.mp3",
-        "channel_1": tmp_path / "channel_1.mp3",
+        "retrying": audio_dir / "error_retrying.mp3",
+        "failed": audio_dir / "error_failed.mp3",
+        "no_internet": audio_dir / "error_no_internet.mp3",
+        "goodbye": audio_dir / "goodbye.mp3",
+        "selector_off": audio_dir / "selector_off.mp3",
+        "shutdown": audio_dir / "shutdown.mp3",
+        "channel_1": audio_dir / "channel_1.mp3",
     }
     for p in files.values():
         p.write_bytes(b"\x00" * 10)
-    return files
+    return MappingProxyType(files)
 
 
 @pytest.fixture
-def make_player(audio_files: dict[str, Path]) -> MakePlayerFixture:
+def make_player(audio_files: Mapping[str, Path]) -> MakePlayerFixture:
     """Factory to create MpvAudioPlayer with configurable retry/watchdog."""
 
     def _make(
@@ -102,7 +104,7 @@ class TestPlayAnnouncement:
         mocker.patch("src.audio.mpv.MPV", mock_mpv_class)
 
         player = make_player()
-        audio_file = list(player._error_announcements.__dict__.values())[0]
+        audio_file = player._error_announcements.retrying
 
         # Run play_announcement in a thread so we can fire the callback
         result_holder = [None]
@@ -318,3 +320,21 @@ class TestConvenienceAnnouncements:
         mock_play = mocker.patch.object(player, "play_announcement", return_value=True)
         player.play_no_internet_announcement()
         mock_play.assert_called_once_with(player._error_announcements.no_internet)
+
+
+class TestPrefetchAnnouncementFiles:
+    def test_advises_existing_files(
+        self, audio_files: Mapping[str, Path], mocker: MockerFixture
+    ) -> None:
+        fadvise = mocker.patch("os.posix_fadvise")
+
+        prefetch_announcement_files((audio_files["goodbye"], audio_files["shutdown"]))
+
+        assert fadvise.call_count == 2
+
+    def test_skips_missing_files(self, tmp_path: Path, mocker: MockerFixture) -> None:
+        fadvise = mocker.patch("os.posix_fadvise")
+
+        prefetch_announcement_files((tmp_path / "missing.mp3",))
+
+        fadvise.assert_not_called()
@@ -2,23 +2,21 @@
 
 from __future__ import annotations
 
+import threading
 import time
-from pathlib import Path
-from threading import Event
+from collections.abc import Callable
+from threading import Event, Lock
 from unittest.mock import MagicMock
 
 import pytest
 
 from src.controller import RadioController
-from src.models import RadioState, SwitchPosition
-from tests.conftest import make_app_config
+from src.models import AppConfig, RadioState, SwitchPosition
 
 
 @pytest.fixture
-def controller_deps(tmp_audio_files: dict[str, Path]) -> dict[str, object]:
+def controller_deps(app_config: AppConfig) -> dict[str, object]:
     """Create controller with all mocked dependencies."""
-    config = make_app_config(tmp_audio_files["audio_dir"])
-
     audio = MagicMock()
     audio.play_announcement.return_value = True
     audio.play_stream.return_value = True
@@ -28,14 +26,14 @@ def controller_deps(tmp_audio_files: dict[str, Path]) -> dict[str, object]:
     network = MagicMock()
 
     controller = RadioController(
-        config=config,
+        config=app_config,
         audio_player=audio,
         network_manager=network,
     )
 
     return {
         "controller": controller,
-        "config": config,
+        "config": app_config,
         "audio": audio,
         "network": network,
     }
@@ -176,20 +174,22 @@ class TestHandleShutdownRequest:
         audio.stop.assert_called()
         audio.play_shutdown_announcement.assert_called_once()
 
-    def test_sets_cancel_event(self, controller_deps: dict) -> None:
+    def test_cancels_worker_generation(self, controller_deps: dict) -> None:
         controller = controller_deps["controller"]
+        generation = controller._worker_generation
         controller.handle_shutdown_request()
-        assert controller._worker_cancel.is_set()
+        assert controller._is_cancelled(generation)
 
 
 class TestShutdown:
     def test_sets_cancel_and_cleans_up(self, controller_deps: dict) -> None:
         controller = controller_deps["controller"]
         audio = controller_deps["audio"]
+        generation = controller._worker_generation
 
         controller.shutdown()
 
-        assert controller._worker_cancel.is_set()
+        assert controller._is_cancelled(generation)
         audio.stop.assert_called()
         audio.cleanup.assert_called_once()
 
@@ -219,7 +219,7 @@ class TestDispatch:
         task1_started = Event()
         task1_cancelled = Event()
 
-        def slow_task() -> None:
+        def slow_task(_generation: int) -> None:
             task1_started.set()
             task1_cancelled.wait(timeout=5.0)
 
@@ -227,7 +227,7 @@ class TestDispatch:
         task1_started.wait(timeout=2.0)
 
         # Dispatch a second task — should cancel the first
-        controller._dispatch(lambda: None)
+        controller._dispatch(lambda _generation: None)
         time.sleep(0.1)
 
         # First dispatch sets cancel before clearing for second
@@ -237,11 +237,33 @@ class TestDispatch:
         controller = controller_deps["controller"]
 
         result = Event()
-        controller._dispatch(result.set)
+        controller._dispatch(lambda _generation: result.set())
         result.wait(timeout=2.0)
 
         assert result.is_set()
 
+    def test_task_sees_cancellation_after_redispatch(
+        self, controller_deps: dict
+    ) -> None:
+        controller = controller_deps["controller"]
+
+        started = Event()
+        release = Event()
+        cancelled: list[bool] = []
+
+        def task(generation: int) -> None:
+            started.set()
+            release.wait(timeout=2.0)
+            cancelled.append(controller._is_cancelled(generation))
+
+        controller._dispatch(task)
+        started.wait(timeout=2.0)
+        controller._cancel_worker()
+        release.set()
+        controller._worker_thread.join(timeout=2.0)
+
+        assert cancelled == [True]
+
 
 class TestGetChannel:
     def test_valid_index(self, controller_deps: dict) -> None:
@@ -254,3 +276,67 @@ class TestGetChannel:
         controller = controller_deps["controller"]
         assert controller._get_channel(99) is None
         assert controller._get_channel(-1) is None
+
+
+class OwnerTrackingLock:
+    """Lock test double that remembers which thread holds it."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._owner: int | None = None
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        acquired = self._lock.acquire(blocking, timeout)
+        if acquired:
+            self._owner = threading.get_ident()
+        return acquired
+
+    def release(self) -> None:
+        self._owner = None
+        self._lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *_exc: object) -> None:
+        self.release()
+
+    def held_by_current_thread(self) -> bool:
+        return self._owner == threading.get_ident()
+
+
+class TestLockDiscipline:
+    def test_audio_never_called_under_lock(self, controller_deps: dict) -> None:
+        controller = controller_deps["controller"]
+        audio = controller_deps["audio"]
+        lock = OwnerTrackingLock()
+        controller._lock = lock
+        held: list[str] = []
+
+        def recording_side_effect(name: str) -> Callable[..., bool]:
+            def side_effect(*_args: object) -> bool:
+                if lock.held_by_current_thread():
+                    held.append(name)
+                return True
+
+            return side_effect
+
+        for name in (
+            "stop",
+            "play_announcement",
+            "play_announcement_with_stream_preload",
+            "play_selector_off_announcement",
+            "play_goodbye_announcement",
+            "play_shutdown_announcement",
+        ):
+            getattr(audio, name).side_effect = recording_side_effect(name)
+
+        controller.handle_startup(SwitchPosition.ON)
+        time.sleep(0.1)
+        controller.handle_channel_button(1)
+        time.sleep(0.1)
+        controller.handle_switch_change(SwitchPosition.OFF)
+        time.sleep(0.1)
+        controller.handle_shutdown_request()
+
+        assert held == []
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from threading import Event
 from unittest.mock import MagicMock
 
+import pytest
+
 from src.gpio import GpioController
 from src.models import GpioConfig, SwitchPosition
 from tests.conftest import FakeGpio
@@ -23,6 +26,12 @@ def make_gpio_config(
     )
 
 
+def wait_for_switch_settle(controller: GpioController) -> None:
+    timer = controller._switch_settle_timer
+    assert timer is not None
+    timer.join(timeout=1.0)
+
+
 class TestGpioControllerStart:
     def test_configures_all_channel_pins(self) -> None:
         gpio = FakeGpio()
@@ -124,11 +133,28 @@ class TestButtonPress:
         callback.assert_called_with(0)
         controller.stop()
 
+    def test_unknown_pin_is_ignored(self) -> None:
+        gpio = FakeGpio()
+        config = make_gpio_config(channel_pins=(17, 22))
+        callback = MagicMock()
+        controller = GpioController(
+            config=config,
+            gpio=gpio,
+            on_channel_button=callback,
+            on_switch_change=MagicMock(),
+        )
+        controller.start()
+
+        controller._handle_button_press(99)
+
+        callback.assert_not_called()
+        controller.stop()
+
 
 class TestSwitchEdge:
     def test_fires_callback_on_state_change(self) -> None:
         gpio = FakeGpio()
-        config = make_gpio_config()
+        config = make_gpio_config(debounce_ms=20)
         callback = MagicMock()
         controller = GpioController(
             config=config,
@@ -143,13 +169,14 @@ class TestSwitchEdge:
         # Simulate switch going LOW (ON when not inverted)
         gpio.set_pin(27, False)
         gpio.simulate_edge(27)
+        wait_for_switch_settle(controller)
 
         callback.assert_called_once_with(SwitchPosition.OFF)
         controller.stop()
 
     def test_ignores_same_state(self) -> None:
         gpio = FakeGpio()
-        config = make_gpio_config()
+        config = make_gpio_config(debounce_ms=20)
         callback = MagicMock()
         controller = GpioController(
             config=config,
@@ -162,13 +189,14 @@ class TestSwitchEdge:
 
         # Simulate edge but pin hasn't changed
         gpio.simulate_edge(27)
+        wait_for_switch_settle(controller)
 
         callback.assert_not_called()
         controller.stop()
 
     def test_invert_switch(self) -> None:
         gpio = FakeGpio()
-        config = make_gpio_config(invert_switch=True)
+        config = make_gpio_config(debounce_ms=20, invert_switch=True)
         callback = MagicMock()
         controller = GpioController(
             config=config,
@@ -182,10 +210,78 @@ class TestSwitchEdge:
         # Switch goes LOW → with invert, this means ON
         gpio.set_pin(27, False)
         gpio.simulate_edge(27)
+        wait_for_switch_settle(controller)
 
         callback.assert_called_once_with(SwitchPosition.ON)
         controller.stop()
 
+    def test_bouncing_edges_coalesce_into_one_callback(self) -> None:
+        gpio = FakeGpio()
+        config = make_gpio_config(debounce_ms=20)
+        callback = MagicMock()
+        controller = GpioController(
+            config=config,
+            gpio=gpio,
+            on_channel_button=MagicMock(),
+            on_switch_change=callback,
+        )
+        gpio.set_pin(27, True)
+        controller.start()
+
+        for state in (False, True, False):
+            gpio.set_pin(27, state)
+            gpio.simulate_edge(27)
+        wait_for_switch_settle(controller)
+
+        callback.assert_called_once_with(SwitchPosition.OFF)
+        controller.stop()
+
+
+class TestLongPress:
+    @pytest.fixture(autouse=True)
+    def short_threshold(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("src.gpio.LONG_PRESS_THRESHOLD_SECONDS", 0.05)
+
+    def test_held_button_requests_shutdown(self) -> None:
+        gpio = FakeGpio()
+        requested = Event()
+        controller = GpioController(
+            config=make_gpio_config(channel_pins=(17, 22)),
+            gpio=gpio,
+            on_channel_button=MagicMock(),
+            on_switch_change=MagicMock(),
+            on_shutdown_requested=requested.set,
+        )
+        controller.start()
+
+        gpio.set_pin(17, False)
+        gpio.simulate_edge(17)
+
+        assert requested.wait(timeout=1.0)
+        controller.stop()
+
+    def test_released_button_does_not_request_shutdown(self) -> None:
+        gpio = FakeGpio()
+        on_shutdown = MagicMock()
+        controller = GpioController(
+            config=make_gpio_config(channel_pins=(17, 22)),
+            gpio=gpio,
+            on_channel_button=MagicMock(),
+            on_switch_change=MagicMock(),
+            on_shutdown_requested=on_shutdown,
+        )
+        controller.start()
+
+        gpio.set_pin(17, False)
+        gpio.simulate_edge(17)
+        gpio.set_pin(17, True)
+        timer = controller._long_press_timer
+        assert timer is not None
+        timer.join(timeout=1.0)
+
+        on_shutdown.assert_not_called()
+        controller.stop()
+
 
 class TestGetSwitchPosition:
     def test_high_is_on(self) -> None:
@@ -0,0 +1,288 @@
+"""Tests for GpiodAdapter using an in-memory fake gpiod module."""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Iterator
+from datetime import timedelta
+from enum import Enum
+from threading import Event
+from types import ModuleType, SimpleNamespace
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.gpio_gpiod import KERNEL_DEBOUNCE_MS, GpiodAdapter
+
+# ---------------------------------------------------------------------------
+# Fake gpiod v2 module
+# ---------------------------------------------------------------------------
+
+
+class Direction(Enum):
+    INPUT = "input"
+
+
+class Bias(Enum):
+    PULL_UP = "pull_up"
+    PULL_DOWN = "pull_down"
+
+
+class Edge(Enum):
+    NONE = "none"
+    RISING = "rising"
+    FALLING = "falling"
+    BOTH = "both"
+
+
+class Value(Enum):
+    INACTIVE = 0
+    ACTIVE = 1
+
+
+class FakeLineSettings(SimpleNamespace):
+    """Records the keyword arguments a LineSettings was built with."""
+
+
+class FakeLineRequest:
+    """Line request whose fd is a real pipe so epoll can wait on it."""
+
+    def __init__(self, pin: int) -> None:
+        self.pin = pin
+        self.value = Value.ACTIVE
+        self.configs: list[FakeLineSettings] = []
+        self.reject_debounce = False
+        self.released = False
+        self._read_fd, self._write_fd = os.pipe()
+        self._pending: list[object] = []
+
+    @property
+    def fd(self) -> int:
+        return self._read_fd
+
+    def get_value(self, line: int) -> Value:
+        return self.value
+
+    def reconfigure_lines(self, config: dict[int, FakeLineSettings]) -> None:
+        settings = config[self.pin]
+        if self.reject_debounce and settings.debounce_period:
+            msg = "debounce not supported"
+            raise OSError(msg)
+        self.configs.append(settings)
+
+    def read_edge_events(self) -> list[object]:
+        os.read(self._read_fd, 4096)
+        events, self._pending = self._pending, []
+        return events
+
+    def push_events(self, count: int) -> None:
+        """Queue a batch of edge events and make the fd readable."""
+        self._pending = [object() for _ in range(count)]
+        os.write(self._write_fd, b"\0")
+
+    def release(self) -> None:
+        self.released = True
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+
+class FakeChip:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.requests: dict[int, FakeLineRequest] = {}
+        self.closed = False
+
+    def request_lines(
+        self, config: dict[int, FakeLineSettings], consumer: str
+    ) -> FakeLineRequest:
+        (pin,) = config
+        request = FakeLineRequest(pin)
+        request.configs.append(config[pin])
+        self.requests[pin] = request
+        return request
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def chips(mocker: MockerFixture) -> list[FakeChip]:
+    """Install a fake gpiod package and collect the chips it opens."""
+    opened: list[FakeChip] = []
+
+    def open_chip(path: str) -> FakeChip:
+        chip = FakeChip(path)
+        opened.append(chip)
+        return chip
+
+    gpiod = ModuleType("gpiod")
+    gpiod.Chip = open_chip  # type: ignore[attr-defined]
+    gpiod.LineSettings = FakeLineSettings  # type: ignore[attr-defined]
+    line = ModuleType("gpiod.line")
+    line.Direction = Direction  # type: ignore[attr-defined]
+    line.Bias = Bias  # type: ignore[attr-defined]
+    line.Edge = Edge  # type: ignore[attr-defined]
+    line.Value = Value  # type: ignore[attr-defined]
+    mocker.patch.dict(sys.modules, {"gpiod": gpiod, "gpiod.line": line})
+    return opened
+
+
+@pytest.fixture
+def adapter(chips: list[FakeChip]) -> Iterator[GpiodAdapter]:
+    gpio = GpiodAdapter()
+    yield gpio
+    gpio.cleanup()
+
+
+class CallbackRecorder:
+    """Callback that counts calls and signals each one."""
+
+    def __init__(self) -> None:
+        self.pins: list[int] = []
+        self.called = Event()
+
+    def __call__(self, pin: int) -> None:
+        self.pins.append(pin)
+        self.called.set()
+
+    def wait(self, timeout: float = 1.0) -> bool:
+        fired = self.called.wait(timeout)
+        self.called.clear()
+        return fired
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestSetupAndRead:
+    def test_read_maps_active_to_high(
+        self, adapter: GpiodAdapter, chips: list[FakeChip]
+    ) -> None:
+        adapter.setup_input(17, pull_up=True)
+        request = chips[0].requests[17]
+
+        assert adapter.read(17) is True
+        request.value = Value.INACTIVE
+        assert adapter.read(17) is False
+
+    def test_pull_up_bias(self, adapter: GpiodAdapter, chips: list[FakeChip]) -> None:
+        adapter.setup_input(17, pull_up=True)
+        adapter.setup_input(27, pull_up=False)
+
+        assert chips[0].requests[17].configs[0].bias is Bias.PULL_UP
+        assert chips[0].requests[27].configs[0].bias is Bias.PULL_DOWN
+
+
+class TestAddEventDetect:
+    def test_uses_fixed_kernel_debounce(
+        self, adapter: GpiodAdapter, chips: list[FakeChip]
+    ) -> None:
+        adapter.setup_input(17, pull_up=True)
+        adapter.add_event_detect(17, "falling", CallbackRecorder(), bouncetime=200)
+
+        settings = chips[0].requests[17].configs[-1]
+        assert settings.edge_detection is Edge.FALLING
+        assert settings.debounce_period == timedelta(milliseconds=KERNEL_DEBOUNCE_MS)
+
+    def test_retries_without_debounce_on_oserror(
+        self, adapter: GpiodAdapter, chips: list[FakeChip]
+    ) -> None:
+        adapter.setup_input(17, pull_up=True)
+        request = chips[0].requests[17]
+        request.reject_debounce = True
+        callback = CallbackRecorder()
+
+        adapter.add_event_detect(17, "falling", callback, bouncetime=200)
+
+        settings = request.configs[-1]
+        assert settings.edge_detection is Edge.FALLING
+        assert settings.debounce_period == timedelta(0)
+        request.push_events(1)
+        assert callback.wait()
+
+    def test_one_callback_per_event_batch(
+        self, adapter: GpiodAdapter, chips: list[FakeChip]
+    ) -> None:
+        adapter.setup_input(17, pull_up=True)
+        callback = CallbackRecorder()
+        adapter.add_event_detect(17, "both", callback, bouncetime=200)
+        request = chips[0].requests[17]
+
+        request.push_events(3)
+        assert callback.wait()
+        request.push_events(2)
+        assert callback.wait()
+
+        assert callback.pins == [17, 17]
+
+    def test_empty_batch_does_not_fire(
+        self, adapter: GpiodAdapter, chips: list[FakeChip]
+    ) -> None:
+        adapter.setup_input(17, pull_up=True)
+        callback = CallbackRecorder()
+        adapter.add_event_detect(17, "both", callback, bouncetime=200)
+
+        chips[0].requests[17].push_events(0)
+
+        assert not callback.wait(timeout=0.1)
+
+    def test_failing_callback_keeps_thread_alive(
+        self, adapter: GpiodAdapter, chips: list[FakeChip]
+    ) -> None:
+        adapter.setup_input(17, pull_up=True)
+        adapter.setup_input(22, pull_up=True)
+        recorder = CallbackRecorder()
+
+        def failing(_pin: int) -> None:
+            raise RuntimeError("boom")
+
+        adapter.add_event_detect(17, "falling", failing, bouncetime=200)
+        adapter.add_event_detect(22, "falling", recorder, bouncetime=200)
+
+        chips[0].requests[17].push_events(1)
+        chips[0].requests[22].push_events(1)
+
+        assert recorder.wait()
+
+
+class TestCleanup:
+    def test_wakes_and_joins_event_thread(
+        self, adapter: GpiodAdapter, chips: list[FakeChip]
+    ) -> None:
+        adapter.setup_input(17, pull_up=True)
+        adapter.add_event_detect(17, "falling", CallbackRecorder(), bouncetime=200)
+        thread = adapter._thread
+        assert thread is not None
+        assert thread.is_alive()
+
+        adapter.cleanup()
+
+        assert not thread.is_alive()
+        assert adapter._thread is None
+        assert chips[0].requests[17].released
+        assert chips[0].closed
+
+    def test_without_event_thread(
+        self, adapter: GpiodAdapter, chips: list[FakeChip]
+    ) -> None:
+        adapter.setup_input(17, pull_up=True)
+
+        adapter.cleanup()
+
+        assert chips[0].requests[17].released
+        assert chips[0].closed
+
+    def test_second_cleanup_is_noop(
+        self, adapter: GpiodAdapter, chips: list[FakeChip]
+    ) -> None:
+        adapter.setup_input(17, pull_up=True)
+        adapter.add_event_detect(17, "falling", CallbackRecorder(), bouncetime=200)
+
+        adapter.cleanup()
+        adapter.cleanup()
+
+        assert adapter._thread is None
+        assert chips[0].closed
@@ -0,0 +1,72 @@
+"""Tests for KeyboardGpioAdapter without a TTY."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.gpio_mock import KeyboardGpioAdapter
+
+BUTTON_PIN = 17
+
+
+@pytest.fixture
+def adapter(monkeypatch: pytest.MonkeyPatch) -> Iterator[KeyboardGpioAdapter]:
+    monkeypatch.setattr(KeyboardGpioAdapter, "_HOLD_WINDOW_SECONDS", 0.05)
+    gpio = KeyboardGpioAdapter(channel_pins=(BUTTON_PIN, 22), switch_pin=27)
+    yield gpio
+    gpio.cleanup()
+
+
+def press_button(adapter: KeyboardGpioAdapter) -> MagicMock:
+    adapter.setup_input(BUTTON_PIN, pull_up=True)
+    callback = MagicMock()
+    adapter.add_event_detect(BUTTON_PIN, "falling", callback, bouncetime=0)
+    adapter._handle_channel_key(0)
+    return callback
+
+
+class TestButtonPress:
+    def test_fires_one_falling_callback(self, adapter: KeyboardGpioAdapter) -> None:
+        callback = press_button(adapter)
+
+        callback.assert_called_once_with(BUTTON_PIN)
+        assert adapter.read(BUTTON_PIN) is False
+
+    def test_repeat_within_hold_window_extends_press(
+        self, adapter: KeyboardGpioAdapter
+    ) -> None:
+        callback = press_button(adapter)
+        first_timer = adapter._release_timers[BUTTON_PIN]
+
+        adapter._handle_channel_key(0)
+        first_timer.join(timeout=1.0)
+
+        callback.assert_called_once_with(BUTTON_PIN)
+        assert adapter.read(BUTTON_PIN) is False
+        assert adapter._release_timers[BUTTON_PIN] is not first_timer
+
+    def test_releases_to_pull_up_after_hold_window(
+        self, adapter: KeyboardGpioAdapter
+    ) -> None:
+        press_button(adapter)
+        adapter._handle_channel_key(0)
+        release_timer = adapter._release_timers[BUTTON_PIN]
+
+        release_timer.join(timeout=1.0)
+
+        assert adapter.read(BUTTON_PIN) is True
+        assert adapter._release_timers == {}
+
+
+class TestCleanup:
+    def test_second_cleanup_is_noop(self, adapter: KeyboardGpioAdapter) -> None:
+        press_button(adapter)
+
+        adapter.cleanup()
+        adapter.cleanup()
+
+        assert not adapter._thread.is_alive()
+        assert adapter._release_timers == {}
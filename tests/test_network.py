@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import subprocess
+from unittest.mock import MagicMock
 
 import pytest
 from pytest_mock import MockerFixture
@@ -95,6 +96,9 @@ class TestToInt:
     def test_empty_string(self) -> None:
         assert _to_int("") is None
 
+    def test_surrounding_whitespace(self) -> None:
+        assert _to_int(" 67\n") == 67
+
 
 # ---------------------------------------------------------------------------
 # NetworkManager with subprocess mocking
@@ -152,31 +156,59 @@ class TestCheckConnectivity:
         status = network_mgr.check_connectivity()
         assert status.is_connected is False
 
+    def test_missing_nmcli_is_not_retried(
+        self, network_mgr: NetworkManager, mocker: MockerFixture
+    ) -> None:
+        run = mocker.patch("subprocess.run", side_effect=FileNotFoundError("nmcli"))
+
+        first = network_mgr.list_saved_wifi()
+        second = network_mgr.list_saved_wifi()
+
+        assert run.call_count == 1
+        assert first.error == second.error
+        assert second.error is not None
+
+    def test_socket_probe_succeeds_if_any_host_answers(
+        self, mocker: MockerFixture
+    ) -> None:
+        mgr = NetworkManager(
+            nmcli_path="nmcli",
+            command_timeout_seconds=5.0,
+            connect_timeout_seconds=20.0,
+            internet_check_hosts=("10.0.0.1", "1.1.1.1"),
+            internet_check_port=53,
+            internet_check_timeout_seconds=1.0,
+        )
+        mocker.patch("subprocess.run", side_effect=FileNotFoundError("nmcli"))
+
+        def connect(address: tuple[str, int], timeout: float) -> MagicMock:
+            if address[0] == "10.0.0.1":
+                raise OSError("no route")
+            return MagicMock()
+
+        mocker.patch("socket.create_connection", side_effect=connect)
+
+        status = mgr.check_connectivity()
+        assert status.is_connected is True
+
 
 class TestListSavedWifi:
     def test_parses_saved_networks(
         self, network_mgr: NetworkManager, mocker: MockerFixture
     ) -> None:
         # Multiline format as produced by `nmcli -m multiline -t`
-        # list_saved_wifi calls _run_nmcli once, then _get_active_wifi_names
-        # which calls _run_nmcli again. We need to mock both.
         list_output = (
             "NAME:Home WiFi\n"
             "TYPE:wifi\n"
+            "ACTIVE:yes\n"
             "802-11-wireless.ssid:HomeSSID\n"
             "802-11-wireless-security.key-mgmt:wpa-psk\n"
         )
-        active_output = ""  # No active wifi
-        mocker.patch(
+        run = mocker.patch(
             "subprocess.run",
-            side_effect=[
-                subprocess.CompletedProcess(
-                    args=[], returncode=0, stdout=list_output, stderr=""
-                ),
-                subprocess.CompletedProcess(
-                    args=[], returncode=0, stdout=active_output, stderr=""
-                ),
-            ],
+            return_value=subprocess.CompletedProcess(
+                args=[], returncode=0, stdout=list_output, stderr=""
+            ),
         )
 
         result = network_mgr.list_saved_wifi()
@@ -186,6 +218,8 @@ class TestListSavedWifi:
         assert len(networks) == 1
         assert networks[0].name == "Home WiFi"
         assert networks[0].ssid == "HomeSSID"
+        assert networks[0].is_active is True
+        assert run.call_count == 1
 
     def test_nmcli_timeout(
         self, network_mgr: NetworkManager, mocker: MockerFixture
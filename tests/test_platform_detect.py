@@ -0,0 +1,17 @@
+"""Tests for platform detection and GPIO backend selection."""
+
+from __future__ import annotations
+
+from pytest_mock import MockerFixture
+
+from src.platform_detect import get_default_gpio_backend
+
+
+class TestGetDefaultGpioBackend:
+    def test_raspberry_pi_uses_rpi(self, mocker: MockerFixture) -> None:
+        mocker.patch("src.platform_detect.is_raspberry_pi", return_value=True)
+        assert get_default_gpio_backend() == "rpi"
+
+    def test_other_platforms_use_mock(self, mocker: MockerFixture) -> None:
+        mocker.patch("src.platform_detect.is_raspberry_pi", return_value=False)
+        assert get_default_gpio_backend() == "mock"